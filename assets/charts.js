@@ -0,0 +1,50 @@
+// Client-side chart updates: turns the new data points pushed by the server
+// into extendData updates, so the browser only appends to existing traces
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    telemetry: {
+        extendCharts: function(points, config) {
+            if (!points) {
+                const noUpdate = window.dash_clientside.no_update;
+                return [noUpdate, noUpdate, noUpdate];
+            }
+
+            const time = points.time;
+            const maxPoints = config.max_points;
+
+            // Each update is [new data, trace indices, max points kept per trace]
+            const imuUpdate = [
+                {x: [time, time, time], y: [points.roll, points.pitch, points.yaw]},
+                [0, 1, 2],
+                maxPoints
+            ];
+            const altTempUpdate = [
+                {x: [time, time], y: [points.altitude, points.temperature]},
+                [0, 1],
+                maxPoints
+            ];
+            // Extend the path, and replace the current position marker
+            const gpsUpdate = [
+                {
+                    lat: [points.latitude, points.latitude.slice(-1)],
+                    lon: [points.longitude, points.longitude.slice(-1)]
+                },
+                [0, 1],
+                {lat: [maxPoints, 1], lon: [maxPoints, 1]}
+            ];
+
+            // Keep the map centred on the drone, relayout only touches the view, the
+            // figure prop stays as it is so the extended traces are not re-plotted
+            const gpsGraph = document.querySelector('#gps-map .js-plotly-plot');
+            if (gpsGraph && window.Plotly) {
+                window.Plotly.relayout(gpsGraph, {
+                    'map.center': {
+                        lat: points.latitude[points.latitude.length - 1],
+                        lon: points.longitude[points.longitude.length - 1]
+                    }
+                });
+            }
+
+            return [imuUpdate, altTempUpdate, gpsUpdate];
+        }
+    }
+});
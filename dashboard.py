@@ -1,100 +1,455 @@
 import asyncio
-import json
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+import orjson
 import websockets
 import threading
-import queue
+import collections
+import functools
 import dash
-from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash import dcc, html, Patch
+from dash.dependencies import Input, Output, State, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import math
 from datetime import datetime
+from dataclasses import dataclass
 import time
 
 # Configuration
 WS_SERVER = 'ws://localhost:8765'
 MAX_DATA_POINTS = 100  # Maximum number of data points for time-series charts
+MAX_DISPLAY_POINTS = 800  # Points sent to the charts per update, roughly the chart width in pixels
+INGEST_INTERVAL = 50  # Milliseconds between moving received data into the DataStore
+RENDER_INTERVAL = 250  # Milliseconds between dashboard redraws
+# Largest accepted WebSocket frame in bytes. A frame carries BATCH_SIZE data points from the
+# transmitter at about 300 bytes each, so keep this above BATCH_SIZE * 300 (64 KiB fits ~220)
+MAX_FRAME_SIZE = 2**16
 
-# Queue to hold data between websocket thread and Dash
-data_queue = queue.Queue()
+# Buffer to hold data between websocket thread and Dash
+# (bounded, since older points would be dropped from the DataStore anyway)
+data_buffer = collections.deque(maxlen=MAX_DATA_POINTS)
+data_lock = threading.Lock()
+
+# Latest telemetry values, parsed once when a data point is added
+@dataclass(slots=True)
+class Telemetry:
+    timestamp: float
+    battery_voltage: float
+    battery_percentage: float
+    temperature: float
+    altitude: float
+    roll: float
+    pitch: float
+    yaw: float
+    latitude: float
+    longitude: float
+    connection_status: str
+    signal_strength: int
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Flatten a telemetry message received from the transmitter"""
+        return cls(
+            timestamp=data['timestamp'],
+            battery_voltage=data['battery']['voltage'],
+            battery_percentage=data['battery']['percentage'],
+            temperature=data['sensors']['temperature'],
+            altitude=data['sensors']['altitude'],
+            roll=data['imu']['roll'],
+            pitch=data['imu']['pitch'],
+            yaw=data['imu']['yaw'],
+            latitude=data['gps']['latitude'],
+            longitude=data['gps']['longitude'],
+            connection_status=data['connection']['status'],
+            signal_strength=data['connection']['signal_strength']
+        )
 
 # Storage for historical data
 class DataStore:
+    # Column layout of the history buffer
+    COLUMNS = {
+        'battery_voltage': 0,
+        'temperature': 1,
+        'altitude': 2,
+        'roll': 3,
+        'pitch': 4,
+        'yaw': 5,
+        'latitude': 6,
+        'longitude': 7,
+        'connection_strength': 8
+    }
+
     def __init__(self, max_points=MAX_DATA_POINTS):
         self.max_points = max_points
-        self.timestamps = []
-        self.battery_voltage = []
-        self.temperature = []
-        self.altitude = []
-        self.roll = []
-        self.pitch = []
-        self.yaw = []
-        self.latitude = []
-        self.longitude = []
-        self.connection_strength = []
-        self.latest_data = None
+        # Preallocated ring buffer, one row per data point
+        self.ts = np.empty(max_points, dtype=np.float64)  # Unix time in seconds
+        self.data = np.empty((max_points, len(self.COLUMNS)), dtype=np.float64)
+        self.head = 0   # Total number of points written
+        self.latest = None
     
     def add_data(self, data):
         """Add new data point to the store"""
-        self.latest_data = data
-        timestamp = datetime.fromisoformat(data['timestamp'])
-        
-        # Add new data points
-        self.timestamps.append(timestamp)
-        self.battery_voltage.append(data['battery']['voltage'])
-        self.temperature.append(data['sensors']['temperature'])
-        self.altitude.append(data['sensors']['altitude'])
-        self.roll.append(data['imu']['roll'])
-        self.pitch.append(data['imu']['pitch'])
-        self.yaw.append(data['imu']['yaw'])
-        self.latitude.append(data['gps']['latitude'])
-        self.longitude.append(data['gps']['longitude'])
-        self.connection_strength.append(data['connection']['signal_strength'])
+        latest = Telemetry.from_dict(data)
+        self.latest = latest
+        idx = self.head % self.max_points
         
-        # Trim lists if they exceed max_points
-        if len(self.timestamps) > self.max_points:
-            self.timestamps = self.timestamps[-self.max_points:]
-            self.battery_voltage = self.battery_voltage[-self.max_points:]
-            self.temperature = self.temperature[-self.max_points:]
-            self.altitude = self.altitude[-self.max_points:]
-            self.roll = self.roll[-self.max_points:]
-            self.pitch = self.pitch[-self.max_points:]
-            self.yaw = self.yaw[-self.max_points:]
-            self.latitude = self.latitude[-self.max_points:]
-            self.longitude = self.longitude[-self.max_points:]
-            self.connection_strength = self.connection_strength[-self.max_points:]
+        # Overwrite the oldest slot in place
+        self.ts[idx] = latest.timestamp
+        self.data[idx] = (
+            latest.battery_voltage,
+            latest.temperature,
+            latest.altitude,
+            latest.roll,
+            latest.pitch,
+            latest.yaw,
+            latest.latitude,
+            latest.longitude,
+            latest.signal_strength
+        )
+        self.head += 1
+    
+    def since(self, head):
+        """Return (timestamps, data, head) for the points written after `head`, oldest first.
+
+        The returned head is the one the points were read up to, pass it back in to
+        continue from there. Points that have already been overwritten are skipped.
+        The arrays are copies, add_data can't change them while they are being used.
+        """
+        # Read the head once, add_data may run concurrently on another thread
+        current = self.head
+        new = min(current - head, current, self.max_points)
+        if new <= 0:
+            return self.ts[:0], self.data[:0], current
+        start = (current - new) % self.max_points
+        end = start + new
+        if end <= self.max_points:
+            return self.ts[start:end].copy(), self.data[start:end].copy(), current
+        end -= self.max_points
+        return (np.concatenate((self.ts[start:], self.ts[:end])),
+                np.concatenate((self.data[start:], self.data[:end])),
+                current)
 
 data_store = DataStore()
 
+# Local HH:MM:SS strings for the time-series charts
+def format_times(timestamps):
+    """Format Unix timestamps as local HH:MM:SS strings in one vectorized step."""
+    offset = time.localtime(timestamps[-1]).tm_gmtoff  # Local UTC offset in seconds
+    local = (timestamps + offset).astype(np.int64).astype('datetime64[s]')
+    return np.char.partition(np.datetime_as_string(local), 'T')[:, 2].tolist()
+
+# Largest-Triangle-Three-Buckets downsampling for the time-series charts
+def lttb_indices(x, y, n_out):
+    """Return the indices of the n_out points that best preserve the shape of (x, y)."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept, the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        
+        # Average of the next bucket (the last point for the final bucket)
+        next_start, next_end = (end, edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and that average
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[b + 1] = a
+    
+    return indices
+
 # WebSocket client function (runs in separate thread)
 async def websocket_client():
     while True:
         try:
-            async with websockets.connect(WS_SERVER) as websocket:
+            # Bounded frame size and receive queue, see MAX_FRAME_SIZE
+            async with websockets.connect(WS_SERVER, max_size=MAX_FRAME_SIZE, max_queue=32,
+                                          compression=None) as websocket:
                 print(f"Connected to transmitter at {WS_SERVER}")
-                while True:
-                    data = await websocket.recv()
-                    data_json = json.loads(data)
-                    data_queue.put(data_json)
+                # Binary frames arrive as bytes, skipping UTF-8 decoding
+                async for data in websocket:
+                    data_json = orjson.loads(data)
+                    
+                    # A frame holds either a single data point or a batch of them
+                    with data_lock:
+                        if isinstance(data_json, list):
+                            data_buffer.extend(data_json)
+                        else:
+                            data_buffer.append(data_json)
         except Exception as e:
             print(f"Connection error: {e}. Reconnecting in 5 seconds...")
             await asyncio.sleep(5)
 
 # Thread function to run the WebSocket client
 def websocket_thread_function():
-    asyncio.run(websocket_client())
+    if uvloop is not None:
+        uvloop.run(websocket_client())
+    else:
+        asyncio.run(websocket_client())
+
+# Drone model for the 3D orientation display, a cross with 4 arms
+DRONE_SIZE = 0.8
+BODY_SIZE = DRONE_SIZE * 0.3
+ARM_LENGTH = DRONE_SIZE
+ARM_THICKNESS = 0.05
+
+# Main body points
+BODY_POINTS = np.array([
+    [BODY_SIZE, BODY_SIZE, 0.05],
+    [BODY_SIZE, -BODY_SIZE, 0.05],
+    [-BODY_SIZE, -BODY_SIZE, 0.05],
+    [-BODY_SIZE, BODY_SIZE, 0.05],
+    [BODY_SIZE, BODY_SIZE, -0.05],
+    [BODY_SIZE, -BODY_SIZE, -0.05],
+    [-BODY_SIZE, -BODY_SIZE, -0.05],
+    [-BODY_SIZE, BODY_SIZE, -0.05]
+])
+BODY_I = [7, 0, 0, 3, 4, 4, 6, 6, 1, 1, 7, 3, 0, 0, 5, 5, 2, 2, 7]
+BODY_J = [3, 7, 4, 0, 7, 0, 3, 0, 5, 0, 4, 4, 1, 5, 1, 6, 1, 6, 6]
+BODY_K = [0, 3, 7, 4, 4, 1, 1, 2, 2, 5, 5, 3, 2, 2, 6, 1, 5, 5, 2]
+
+# Arm points, in front, back, right, left order
+ARM_POINTS = [
+    np.array([
+        [0, 0, ARM_THICKNESS], [0, 0, -ARM_THICKNESS],
+        [x, y, ARM_THICKNESS], [x, y, -ARM_THICKNESS]
+    ])
+    for x, y in ((0, ARM_LENGTH), (0, -ARM_LENGTH), (ARM_LENGTH, 0), (-ARM_LENGTH, 0))
+]
+ARM_COLORS = ('red', 'green', 'blue', 'yellow')
+ARM_I, ARM_J, ARM_K = [0, 0, 2], [1, 2, 3], [3, 1, 1]
+
+# All drone vertices stacked, so one matrix product rotates the whole model
+DRONE_POINTS = np.vstack([BODY_POINTS] + ARM_POINTS)
+DRONE_PART_SPLITS = np.cumsum([len(BODY_POINTS)] + [len(arm) for arm in ARM_POINTS])[:-1]
+DRONE_TRACE_OFFSET = 3  # Ring and two reference axes come first in the figure
+
+# Reference ring (for orientation), stays fixed
+RING_RADIUS = ARM_LENGTH * 1.2
+RING_SEGMENTS = 36
+_ring_angles = np.linspace(0, 2 * np.pi, RING_SEGMENTS + 1)
+RING_POINTS = np.column_stack((
+    RING_RADIUS * np.cos(_ring_angles),
+    RING_RADIUS * np.sin(_ring_angles),
+    np.zeros(RING_SEGMENTS + 1)
+))
+AXIS_LENGTH = ARM_LENGTH * 0.75
+
+# Initial figures (callbacks only send incremental updates to these)
+def create_imu_figure():
+    fig = make_subplots(specs=[[{"secondary_y": False}]])
+    
+    # Roll, Pitch and Yaw traces, extended as data arrives
+    fig.add_trace(go.Scattergl(x=[], y=[], name="Roll", line=dict(color="#FF4136")))
+    fig.add_trace(go.Scattergl(x=[], y=[], name="Pitch", line=dict(color="#2ECC40")))
+    fig.add_trace(go.Scattergl(x=[], y=[], name="Yaw", line=dict(color="#0074D9")))
+    
+    fig.update_layout(
+        xaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
+        yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
+        plot_bgcolor='#1E1E1E',
+        paper_bgcolor='#1E1E1E',
+        font=dict(color='white'),
+        margin=dict(l=40, r=40, t=10, b=40),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        height=300
+    )
+    
+    return fig
+
+def create_alt_temp_figure():
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    # Altitude trace, and Temperature trace on the secondary y-axis
+    fig.add_trace(go.Scattergl(x=[], y=[], name="Altitude (m)", line=dict(color="#FF851B")))
+    fig.add_trace(
+        go.Scattergl(x=[], y=[], name="Temperature (°C)", line=dict(color="#B10DC9")),
+        secondary_y=True
+    )
+    
+    fig.update_layout(
+        xaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
+        yaxis=dict(
+            showgrid=True, 
+            gridcolor='rgba(255,255,255,0.1)', 
+            tickfont=dict(color='white'),
+            title="Altitude (m)"
+        ),
+        yaxis2=dict(
+            showgrid=False, 
+            tickfont=dict(color='white'),
+            title="Temperature (°C)",
+            overlaying="y",
+            side="right"
+        ),
+        plot_bgcolor='#1E1E1E',
+        paper_bgcolor='#1E1E1E',
+        font=dict(color='white'),
+        margin=dict(l=40, r=40, t=10, b=40),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        height=300
+    )
+    
+    return fig
+
+def create_gps_figure():
+    fig = go.Figure()
+    
+    # Path
+    fig.add_trace(go.Scattermap(
+        lat=[],
+        lon=[],
+        mode='lines+markers',
+        marker=dict(size=8, color='royalblue'),
+        line=dict(width=2, color='royalblue'),
+        name='Path'
+    ))
+    
+    # Current position marker
+    fig.add_trace(go.Scattermap(
+        lat=[],
+        lon=[],
+        mode='markers',
+        marker=dict(
+            size=13,
+            color='red',
+            symbol='circle'
+        ),
+        name='Current Position'
+    ))
+    
+    fig.update_layout(
+        map=dict(
+            style="dark",
+            zoom=13,
+            center=dict(lat=11.064754, lon=77.093565)
+        ),
+        margin={"r": 0, "t": 0, "l": 0, "b": 0},
+        height=300,
+        paper_bgcolor='#1E1E1E',
+        plot_bgcolor='#1E1E1E',
+    )
+    
+    return fig
+
+def create_orientation_figure():
+    fig = go.Figure()
+    
+    # Add reference ring (red)
+    fig.add_trace(go.Scatter3d(
+        x=RING_POINTS[:, 0], y=RING_POINTS[:, 1], z=RING_POINTS[:, 2],
+        mode='lines',
+        line=dict(color='red', width=5),
+        showlegend=False
+    ))
+    
+    # Add reference axes
+    # Forward reference (blue z-axis)
+    fig.add_trace(go.Scatter3d(
+        x=[0, 0], y=[0, AXIS_LENGTH], z=[0, 0],
+        mode='lines',
+        line=dict(color='blue', width=5),
+        showlegend=False
+    ))
+    
+    # Right reference (green x-axis)
+    fig.add_trace(go.Scatter3d(
+        x=[0, AXIS_LENGTH], y=[0, 0], z=[0, 0],
+        mode='lines',
+        line=dict(color='green', width=5),
+        showlegend=False
+    ))
+    
+    # Add drone body, vertices are filled in by update_orientation_display
+    fig.add_trace(go.Mesh3d(
+        x=[], y=[], z=[],
+        i=BODY_I, j=BODY_J, k=BODY_K,
+        color='grey',
+        opacity=0.8,
+        showlegend=False
+    ))
+    
+    # Add arms
+    for color in ARM_COLORS:
+        fig.add_trace(go.Mesh3d(
+            x=[], y=[], z=[],
+            i=ARM_I, j=ARM_J, k=ARM_K,
+            color=color,
+            opacity=0.8,
+            showlegend=False
+        ))
+    
+    # Set layout
+    fig.update_layout(
+        scene=dict(
+            xaxis=dict(range=[-1, 1], showbackground=False, visible=False),
+            yaxis=dict(range=[-1, 1], showbackground=False, visible=False),
+            zaxis=dict(range=[-1, 1], showbackground=False, visible=False),
+            aspectmode="cube"
+        ),
+        margin=dict(l=0, r=0, b=0, t=0),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        scene_camera=dict(eye=dict(x=1, y=1, z=1))
+    )
+    
+    return fig
+
+# Labels of the telemetry data values, in display order
+TELEMETRY_LABELS = (
+    "Battery: ",
+    "Temperature: ",
+    "Altitude: ",
+    "Roll: ",
+    "Pitch: ",
+    "Yaw: ",
+    "GPS: ",
+    "Connection: ",
+    "Last Updated: "
+)
+
+# Render callbacks skip a tick while their previous run is still in progress
+def skip_if_busy(callback):
+    lock = threading.Lock()
+    
+    @functools.wraps(callback)
+    def wrapper(*args):
+        if not lock.acquire(blocking=False):
+            raise PreventUpdate
+        try:
+            return callback(*args)
+        finally:
+            lock.release()
+    
+    return wrapper
 
 # Initialize Dash app
 app = dash.Dash(__name__, 
     title="Drone Telemetry Dashboard",
-    update_title="Updating...",
+    update_title=None,  # Don't rewrite the tab title on every update
+    compress=True,      # Gzip responses (requires flask-compress)
     meta_tags=[
         {"name": "viewport", "content": "width=device-width, initial-scale=1"}
     ]
 )
 
+# Asset URLs carry a modification-time query string, so they can be cached long-term
+app.server.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000  # One year, in seconds
+
 # App layout
 app.layout = html.Div([
     html.Div([
@@ -119,71 +474,87 @@ app.layout = html.Div([
             html.Div([
                 html.Div([
                     html.H4("IMU Data"),
-                    dcc.Graph(id='imu-chart', className='graph-display')
+                    dcc.Graph(id='imu-chart', figure=create_imu_figure(), className='graph-display')
                 ], className='chart-card'),
                 
                 html.Div([
                     html.H4("Altitude & Temperature"),
-                    dcc.Graph(id='alt-temp-chart', className='graph-display')
+                    dcc.Graph(id='alt-temp-chart', figure=create_alt_temp_figure(), className='graph-display')
                 ], className='chart-card')
             ], className='chart-row'),
             
             # Real-time data values
             html.Div([
-                html.Div(id='telemetry-data', className='data-values')
+                html.Div(html.Div("No data received yet."), id='telemetry-data', className='data-values')
             ], className='data-row'),
             
             # 3D orientation display and GPS map
             html.Div([
                 html.Div([
                     html.H4("Drone Orientation (IMU)"),
-                    dcc.Graph(id='orientation-display', className='graph-display')
+                    dcc.Graph(id='orientation-display', figure=create_orientation_figure(), className='graph-display')
                 ], className='viz-card'),
                 
                 html.Div([
                     html.H4("GPS Position"),
-                    dcc.Graph(id='gps-map', className='graph-display')
+                    dcc.Graph(id='gps-map', figure=create_gps_figure(), className='graph-display')
                 ], className='viz-card')
             ], className='viz-row'),
         ], className='dashboard-container')
     ], className='main-content'),
     
-    # Interval component for updating the data
+    # Interval components for ingesting the data and updating the display
     dcc.Interval(
-        id='interval-component',
-        interval=100,  # in milliseconds
+        id='ingest-interval',
+        interval=INGEST_INTERVAL,
         n_intervals=0
     ),
+    dcc.Interval(
+        id='render-interval',
+        interval=RENDER_INTERVAL,
+        n_intervals=0
+    ),
+    
+    # Number of data points already sent to this browser session
+    dcc.Store(id='render-cursor', data=0),
+    
+    # Telemetry values currently shown in this browser session
+    dcc.Store(id='telemetry-values'),
+    
+    # New data points for the charts, and the settings the client-side callback needs
+    dcc.Store(id='latest-points'),
+    dcc.Store(id='chart-config', data={'max_points': MAX_DATA_POINTS}),
     
     html.Div([], style={'display': 'none'}, id='css-container')
 ])
 
 # Process queue data
 @app.callback(
-    Output('interval-component', 'n_intervals'),
-    Input('interval-component', 'n_intervals')
+    Output('ingest-interval', 'n_intervals'),
+    Input('ingest-interval', 'n_intervals')
 )
 def process_queue(n):
-    # Process all available data in the queue
-    while not data_queue.empty():
-        try:
-            data = data_queue.get_nowait()
-            data_store.add_data(data)
-        except queue.Empty:
-            break
+    global data_buffer
+    
+    # Swap out all buffered data in one step, then process it without holding the lock
+    with data_lock:
+        batch, data_buffer = data_buffer, collections.deque(maxlen=MAX_DATA_POINTS)
+    
+    for data in batch:
+        data_store.add_data(data)
     return n
 
 # Connection status callback
 @app.callback(
     Output('connection-status', 'children'),
     Output('connection-status', 'style'),
-    Input('interval-component', 'n_intervals')
+    Input('render-interval', 'n_intervals')
 )
 def update_connection_status(n):
-    if data_store.latest_data is None:
+    if data_store.latest is None:
         return "No Data", {'backgroundColor': '#555555'}
     
-    status = data_store.latest_data['connection']['status']
+    status = data_store.latest.connection_status
     
     colors = {
         "Excellent": "#4CAF50",  # Green
@@ -202,14 +573,14 @@ def update_connection_status(n):
 @app.callback(
     Output('battery-indicator', 'children'),
     Output('battery-indicator', 'style'),
-    Input('interval-component', 'n_intervals')
+    Input('render-interval', 'n_intervals')
 )
 def update_battery_indicator(n):
-    if data_store.latest_data is None:
+    if data_store.latest is None:
         return "No Data", {'backgroundColor': '#555555'}
     
-    voltage = data_store.latest_data['battery']['voltage']
-    percentage = data_store.latest_data['battery']['percentage']
+    voltage = data_store.latest.battery_voltage
+    percentage = data_store.latest.battery_percentage
     
     # Color based on percentage
     if percentage > 75:
@@ -228,422 +599,142 @@ def update_battery_indicator(n):
         'color': '#000000' if percentage > 25 else '#FFFFFF'
     }
 
+# Rotation matrix for the 3D orientation display
+def euler_to_rotation_matrix(roll, pitch, yaw):
+    """Return R = Rz(yaw) . Ry(pitch) . Rx(roll) for angles in radians."""
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    return np.array([
+        [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+        [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        [-sp, cp * sr, cp * cr]
+    ])
+
 # 3D orientation display callback
 @app.callback(
     Output('orientation-display', 'figure'),
-    Input('interval-component', 'n_intervals')
+    Input('render-interval', 'n_intervals')
 )
+@skip_if_busy
 def update_orientation_display(n):
-    if data_store.latest_data is None:
-        # Create empty figure
-        fig = go.Figure()
-        fig.update_layout(
-            scene=dict(aspectmode="cube"),
-            margin=dict(l=0, r=0, b=0, t=0),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            scene_camera=dict(eye=dict(x=0.75, y=0.75, z=0.75))
-        )
-        return fig
+    if data_store.latest is None:
+        raise PreventUpdate
     
     # Get IMU data
-    roll = data_store.latest_data['imu']['roll'] * np.pi / 180  # Convert to radians
-    pitch = data_store.latest_data['imu']['pitch'] * np.pi / 180
-    yaw = data_store.latest_data['imu']['yaw'] * np.pi / 180
-    
-    # Create rotation matrices
-    def rotation_matrix(axis, theta):
-        """Return the rotation matrix for a counterclockwise rotation of theta radians around axis."""
-        axis = np.asarray(axis)
-        axis = axis / np.sqrt(np.dot(axis, axis))
-        a = np.cos(theta / 2.0)
-        b, c, d = -axis * np.sin(theta / 2.0)
-        aa, bb, cc, dd = a * a, b * b, c * c, d * d
-        bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-        return np.array([
-            [aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-            [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-            [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]
-        ])
-    
-    # Apply rotations in ZYX order (yaw, pitch, roll)
-    R_z = rotation_matrix([0, 0, 0.75], yaw)
-    R_y = rotation_matrix([0, 0.75, 0], pitch)
-    R_x = rotation_matrix([0.75, 0, 0], roll)
-    R = R_z.dot(R_y).dot(R_x)
-    
-    # Create drone model
-    # Define the basic drone shape as a cross with 4 arms
-    drone_size = 0.8
-    center = np.array([0, 0, 0])
-    
-    # Main body points
-    body_size = drone_size * 0.3
-    body_points = np.array([
-        [body_size, body_size, 0.05],
-        [body_size, -body_size, 0.05],
-        [-body_size, -body_size, 0.05],
-        [-body_size, body_size, 0.05],
-        [body_size, body_size, -0.05],
-        [body_size, -body_size, -0.05],
-        [-body_size, -body_size, -0.05],
-        [-body_size, body_size, -0.05]
-    ])
-    
-    # Arms points
-    arm_length = drone_size
-    thickness = 0.05
-    
-    # Define arms and rotors
-    arm_front = np.array([
-        [0, 0, thickness], [0, 0, -thickness], 
-        [0, arm_length, thickness], [0, arm_length, -thickness]
-    ])
-    arm_back = np.array([
-        [0, 0, thickness], [0, 0, -thickness], 
-        [0, -arm_length, thickness], [0, -arm_length, -thickness]
-    ])
-    arm_right = np.array([
-        [0, 0, thickness], [0, 0, -thickness], 
-        [arm_length, 0, thickness], [arm_length, 0, -thickness]
-    ])
-    arm_left = np.array([
-        [0, 0, thickness], [0, 0, -thickness], 
-        [-arm_length, 0, thickness], [-arm_length, 0, -thickness]
-    ])
+    roll = math.radians(data_store.latest.roll)  # Convert to radians
+    pitch = math.radians(data_store.latest.pitch)
+    yaw = math.radians(data_store.latest.yaw)
     
-    # Create reference ring (for orientation)
-    ring_points = []
-    ring_radius = arm_length * 1.2
-    ring_segments = 36
-    for i in range(ring_segments + 1):
-        angle = 2 * np.pi * i / ring_segments
-        ring_points.append([ring_radius * np.cos(angle), ring_radius * np.sin(angle), 0])
-    ring_points = np.array(ring_points)
-    
-    # Apply rotation to all points
-    body_rotated = np.dot(body_points, R.T)
-    arm_front_rotated = np.dot(arm_front, R.T)
-    arm_back_rotated = np.dot(arm_back, R.T)
-    arm_right_rotated = np.dot(arm_right, R.T)
-    arm_left_rotated = np.dot(arm_left, R.T)
-    ring_rotated = ring_points  # Ring stays fixed as reference
-    
-    # Create figure
-    fig = go.Figure()
-    
-    # Add reference ring (red)
-    fig.add_trace(go.Scatter3d(
-        x=ring_rotated[:, 0], y=ring_rotated[:, 1], z=ring_rotated[:, 2],
-        mode='lines',
-        line=dict(color='red', width=5),
-        showlegend=False
-    ))
-    
-    # Add reference axes
-    axis_length = arm_length * 0.75
-    
-    # Forward reference (blue z-axis)
-    fig.add_trace(go.Scatter3d(
-        x=[0, 0], y=[0, axis_length], z=[0, 0],
-        mode='lines',
-        line=dict(color='blue', width=5),
-        showlegend=False
-    ))
-    
-    # Right reference (green x-axis)
-    fig.add_trace(go.Scatter3d(
-        x=[0, axis_length], y=[0, 0], z=[0, 0],
-        mode='lines',
-        line=dict(color='green', width=5),
-        showlegend=False
-    ))
-    
-    # Add drone body
-    i, j, k = np.array([7, 0, 0, 3, 4, 4, 6, 6, 1, 1, 7, 3, 0, 0, 5, 5, 2, 2, 7]), np.array([3, 7, 4, 0, 7, 0, 3, 0, 5, 0, 4, 4, 1, 5, 1, 6, 1, 6, 6]), np.array([0, 3, 7, 4, 4, 1, 1, 2, 2, 5, 5, 3, 2, 2, 6, 1, 5, 5, 2])
-    
-    fig.add_trace(go.Mesh3d(
-        x=body_rotated[:, 0], y=body_rotated[:, 1], z=body_rotated[:, 2],
-        i=i, j=j, k=k,
-        color='grey',
-        opacity=0.8,
-        showlegend=False
-    ))
+    # Rotation in ZYX order (yaw, pitch, roll)
+    R = euler_to_rotation_matrix(roll, pitch, yaw)
     
-    # Add arms
-    # Front arm (red)
-    fig.add_trace(go.Mesh3d(
-        x=arm_front_rotated[:, 0], y=arm_front_rotated[:, 1], z=arm_front_rotated[:, 2],
-        i=[0, 0, 2], j=[1, 2, 3], k=[3, 1, 1],
-        color='red',
-        opacity=0.8,
-        showlegend=False
-    ))
+    # Rotate the whole drone model at once
+    rotated = DRONE_POINTS @ R.T
     
-    # Back arm (green)
-    fig.add_trace(go.Mesh3d(
-        x=arm_back_rotated[:, 0], y=arm_back_rotated[:, 1], z=arm_back_rotated[:, 2],
-        i=[0, 0, 2], j=[1, 2, 3], k=[3, 1, 1],
-        color='green',
-        opacity=0.8,
-        showlegend=False
-    ))
-    
-    # Right arm (blue)
-    fig.add_trace(go.Mesh3d(
-        x=arm_right_rotated[:, 0], y=arm_right_rotated[:, 1], z=arm_right_rotated[:, 2],
-        i=[0, 0, 2], j=[1, 2, 3], k=[3, 1, 1],
-        color='blue',
-        opacity=0.8,
-        showlegend=False
-    ))
-    
-    # Left arm (yellow)
-    fig.add_trace(go.Mesh3d(
-        x=arm_left_rotated[:, 0], y=arm_left_rotated[:, 1], z=arm_left_rotated[:, 2],
-        i=[0, 0, 2], j=[1, 2, 3], k=[3, 1, 1],
-        color='yellow',
-        opacity=0.8,
-        showlegend=False
-    ))
-    
-    # Set layout
-    fig.update_layout(
-        scene=dict(
-            xaxis=dict(range=[-1, 1], showbackground=False, visible=False),
-            yaxis=dict(range=[-1, 1], showbackground=False, visible=False),
-            zaxis=dict(range=[-1, 1], showbackground=False, visible=False),
-            aspectmode="cube"
-        ),
-        margin=dict(l=0, r=0, b=0, t=0),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        scene_camera=dict(eye=dict(x=1, y=1, z=1))
-    )
-    
-    return fig
-
-# GPS Map callback
-@app.callback(
-    Output('gps-map', 'figure'),
-    Input('interval-component', 'n_intervals')
-)
-def update_gps_map(n):
-    fig = go.Figure()
-    
-    if data_store.latest_data is not None and len(data_store.latitude) > 0:
-        # Plot path
-        fig.add_trace(go.Scattermap(
-            lat=data_store.latitude,
-            lon=data_store.longitude,
-            mode='lines+markers',
-            marker=dict(size=8, color='royalblue'),
-            line=dict(width=2, color='royalblue'),
-            name='Path'
-        ))
-        
-        # Add current position marker
-        fig.add_trace(go.Scattermap(
-            lat=[data_store.latitude[-1]],
-            lon=[data_store.longitude[-1]],
-            mode='markers',
-            marker=dict(
-                size=13,
-                color='red',
-                symbol='circle'
-            ),
-            name='Current Position'
-        ))
-    
-    fig.update_layout(
-        mapbox=dict(
-            style="dark",
-            zoom=1000,
-            center=dict(
-                lat=data_store.latitude[-1] if data_store.latest_data else 11.064754,
-                lon=data_store.longitude[-1] if data_store.latest_data else 77.093565
-            )
-        ),
-        margin={"r": 0, "t": 0, "l": 0, "b": 0},
-        height=300,
-        paper_bgcolor='#1E1E1E',
-        plot_bgcolor='#1E1E1E',
-    )
+    # Only send the rotated drone vertices, the rest of the figure stays as is
+    patch = Patch()
+    for index, points in enumerate(np.split(rotated, DRONE_PART_SPLITS), start=DRONE_TRACE_OFFSET):
+        patch['data'][index]['x'] = points[:, 0]
+        patch['data'][index]['y'] = points[:, 1]
+        patch['data'][index]['z'] = points[:, 2]
     
-    return fig
+    return patch
 
-# IMU Chart callback
+# New data points callback, pushes only the points this session hasn't received yet
 @app.callback(
-    Output('imu-chart', 'figure'),
-    Input('interval-component', 'n_intervals')
+    Output('latest-points', 'data'),
+    Output('render-cursor', 'data'),
+    Input('render-interval', 'n_intervals'),
+    State('render-cursor', 'data')
 )
-def update_imu_chart(n):
-    fig = make_subplots(specs=[[{"secondary_y": False}]])
-    
-    if data_store.latest_data is not None and len(data_store.timestamps) > 0:
-        # Format timestamps for display
-        time_strings = [ts.strftime('%H:%M:%S') for ts in data_store.timestamps]
-        
-        # Add Roll data
-        fig.add_trace(
-            go.Scatter(
-                x=time_strings,
-                y=data_store.roll,
-                name="Roll",
-                line=dict(color="#FF4136")
-            )
-        )
-        
-        # Add Pitch data
-        fig.add_trace(
-            go.Scatter(
-                x=time_strings,
-                y=data_store.pitch,
-                name="Pitch",
-                line=dict(color="#2ECC40")
-            )
-        )
-        
-        # Add Yaw data
-        fig.add_trace(
-            go.Scatter(
-                x=time_strings,
-                y=data_store.yaw,
-                name="Yaw",
-                line=dict(color="#0074D9")
-            )
-        )
-    
-    fig.update_layout(
-        xaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
-        yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
-        plot_bgcolor='#1E1E1E',
-        paper_bgcolor='#1E1E1E',
-        font=dict(color='white'),
-        margin=dict(l=40, r=40, t=10, b=40),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=300
-    )
-    
-    return fig
+@skip_if_busy
+def update_latest_points(n, cursor):
+    # A cursor ahead of the store means the dashboard restarted under an open tab,
+    # treat it as a new session and backfill from the start
+    if cursor > data_store.head:
+        cursor = 0
+    
+    timestamps, values, head = data_store.since(cursor)
+    if len(timestamps) == 0:
+        raise PreventUpdate
+    
+    # Downsample large updates (e.g. a new session's backfill) to the display resolution,
+    # keeping the rows picked for any of the charted series
+    if len(timestamps) > MAX_DISPLAY_POINTS:
+        charted = [DataStore.COLUMNS[name] for name in ('roll', 'pitch', 'yaw', 'altitude', 'temperature')]
+        rows = np.unique(np.concatenate([
+            lttb_indices(timestamps, values[:, col], MAX_DISPLAY_POINTS // len(charted)) for col in charted
+        ]))
+        timestamps, values = timestamps[rows], values[rows]
+    
+    # Format timestamps for display
+    time_strings = format_times(timestamps)
+    
+    # One list per column, the time-series charts and GPS path are extended client-side
+    points = {'time': time_strings}
+    for name in ('roll', 'pitch', 'yaw', 'altitude', 'temperature', 'latitude', 'longitude'):
+        points[name] = values[:, DataStore.COLUMNS[name]].tolist()
+    
+    return points, head
 
-# Altitude & Temperature Chart callback
-@app.callback(
-    Output('alt-temp-chart', 'figure'),
-    Input('interval-component', 'n_intervals')
+# Time-series charts and GPS path callback (runs in the browser, see assets/charts.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='telemetry', function_name='extendCharts'),
+    Output('imu-chart', 'extendData'),
+    Output('alt-temp-chart', 'extendData'),
+    Output('gps-map', 'extendData'),
+    Input('latest-points', 'data'),
+    State('chart-config', 'data')
 )
-def update_alt_temp_chart(n):
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    
-    if data_store.latest_data is not None and len(data_store.timestamps) > 0:
-        # Format timestamps for display
-        time_strings = [ts.strftime('%H:%M:%S') for ts in data_store.timestamps]
-        
-        # Add Altitude data
-        fig.add_trace(
-            go.Scatter(
-                x=time_strings,
-                y=data_store.altitude,
-                name="Altitude (m)",
-                line=dict(color="#FF851B")
-            )
-        )
-        
-        # Add Temperature data (on secondary y-axis)
-        fig.add_trace(
-            go.Scatter(
-                x=time_strings,
-                y=data_store.temperature,
-                name="Temperature (°C)",
-                line=dict(color="#B10DC9")
-            ),
-            secondary_y=True
-        )
-    
-    fig.update_layout(
-        xaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
-        yaxis=dict(
-            showgrid=True, 
-            gridcolor='rgba(255,255,255,0.1)', 
-            tickfont=dict(color='white'),
-            title="Altitude (m)"
-        ),
-        yaxis2=dict(
-            showgrid=False, 
-            tickfont=dict(color='white'),
-            title="Temperature (°C)",
-            overlaying="y",
-            side="right"
-        ),
-        plot_bgcolor='#1E1E1E',
-        paper_bgcolor='#1E1E1E',
-        font=dict(color='white'),
-        margin=dict(l=40, r=40, t=10, b=40),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=300
-    )
-    
-    return fig
 
 # Telemetry data values callback
 @app.callback(
     Output('telemetry-data', 'children'),
-    Input('interval-component', 'n_intervals')
+    Output('telemetry-values', 'data'),
+    Input('render-interval', 'n_intervals'),
+    State('telemetry-values', 'data')
 )
-def update_telemetry_data(n):
-    if data_store.latest_data is None:
-        return html.Div("No data received yet.")
-    
-    data = data_store.latest_data
-    
-    telemetry_values = [
-        html.Div([
-            html.Strong("Battery: "),
-            html.Span(f"{data['battery']['voltage']}V ({data['battery']['percentage']}%)")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Temperature: "),
-            html.Span(f"{data['sensors']['temperature']}°C")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Altitude: "),
-            html.Span(f"{data['sensors']['altitude']}m")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Roll: "),
-            html.Span(f"{data['imu']['roll']}°")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Pitch: "),
-            html.Span(f"{data['imu']['pitch']}°")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Yaw: "),
-            html.Span(f"{data['imu']['yaw']}°")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("GPS: "),
-            html.Span(f"Lat: {data['gps']['latitude']}, Lon: {data['gps']['longitude']}")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Connection: "),
-            html.Span(f"{data['connection']['status']} ({data['connection']['signal_strength']}%)")
-        ], className='data-value'),
-        
-        html.Div([
-            html.Strong("Last Updated: "),
-            html.Span(datetime.fromisoformat(data['timestamp']).strftime('%H:%M:%S'))
-        ], className='data-value')
+def update_telemetry_data(n, shown):
+    if data_store.latest is None:
+        raise PreventUpdate
+    
+    data = data_store.latest
+    
+    values = [
+        f"{data.battery_voltage}V ({data.battery_percentage}%)",
+        f"{data.temperature}°C",
+        f"{data.altitude}m",
+        f"{data.roll}°",
+        f"{data.pitch}°",
+        f"{data.yaw}°",
+        f"Lat: {data.latitude}, Lon: {data.longitude}",
+        f"{data.connection_status} ({data.signal_strength}%)",
+        datetime.fromtimestamp(data.timestamp).strftime('%H:%M:%S')
     ]
     
-    return telemetry_values
+    # Nothing to send if this session already shows these values
+    if values == shown:
+        raise PreventUpdate
+    
+    # First data for this session, replace the placeholder with the full list
+    if shown is None:
+        telemetry_values = [
+            html.Div([
+                html.Strong(label),
+                html.Span(value)
+            ], className='data-value')
+            for label, value in zip(TELEMETRY_LABELS, values)
+        ]
+        return telemetry_values, values
+    
+    # Otherwise only update the text of the values that changed
+    patch = Patch()
+    for i, (value, old_value) in enumerate(zip(values, shown)):
+        if value != old_value:
+            patch[i]['props']['children'][1]['props']['children'] = value
+    
+    return patch, values
 
 # Start WebSocket client in a separate thread
 websocket_thread = threading.Thread(target=websocket_thread_function, daemon=True)
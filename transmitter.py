@@ -1,13 +1,29 @@
 import asyncio
-import json
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+import orjson
 import random
 import websockets
 import time
 import math
-from datetime import datetime
+import numpy as np
 
 # Configuration
 UPDATE_INTERVAL = 0.1  # seconds
+BATCH_SIZE = 5         # Data points sent per WebSocket frame
+# Each data point is about 300 bytes, so BATCH_SIZE * 300 must stay below the dashboard's
+# MAX_FRAME_SIZE (64 KiB by default, ~220 data points), or it will refuse the frames
+
+# Decimal places for voltage, percentage, temperature, altitude, roll, pitch, yaw, latitude, longitude
+ROUNDING_SCALE = 10.0 ** np.array([2, 1, 1, 1, 2, 2, 2, 6, 6])
+
+# Random fluctuation ranges per update for battery, temperature, roll, pitch, yaw, altitude
+# and the connection status check, drawn for NOISE_BLOCK updates at a time
+NOISE_LOW = np.array([-0.01, -0.1, -5, -5, -0.5, -3, 0])
+NOISE_HIGH = np.array([0.01, 0.1, 5, 5, 0.5, 3, 1])
+NOISE_BLOCK = 1000
 
 class DroneDataGenerator:
     def __init__(self):
@@ -32,29 +48,35 @@ class DroneDataGenerator:
         # Movement patterns
         self.time_offset = 0
         
+        # Pre-drawn random fluctuations
+        self.rng = np.random.default_rng()
+        self.noise = []
+        self.noise_index = 0
+        
     def generate_data(self):
         """Generate simulated drone telemetry data with realistic patterns"""
         self.time_offset += UPDATE_INTERVAL
+        battery_noise, temp_noise, roll_noise, pitch_noise, yaw_noise, alt_noise, connection_draw = self._next_noise()
         
         # Battery simulation (slowly decreasing with random fluctuations)
         battery_drain_rate = 0.001  # Voltage drop per update
         self.battery_voltage -= battery_drain_rate
-        self.battery_voltage += random.uniform(-0.01, 0.01)  # Small random fluctuations
+        self.battery_voltage += battery_noise  # Small random fluctuations
         self.battery_voltage = max(8.0, min(12.0, self.battery_voltage))  # Keep within reasonable range
         
         # Temperature simulation (slight variations)
-        self.temperature += random.uniform(-0.1, 0.1)
+        self.temperature += temp_noise
         
         # Movement simulation
         movement_factor = 2 * math.sin(self.time_offset / 10)  # Create cyclical movement
         
         # IMU data simulation
-        self.roll = 15 * math.sin(self.time_offset / 5) + random.uniform(-5, 5)
-        self.pitch = 10 * math.cos(self.time_offset / 7) + random.uniform(-5, 5)
-        self.yaw = (self.yaw + 1 + random.uniform(-0.5, 0.5)) % 360  # Slowly rotating with jitter
+        self.roll = 15 * math.sin(self.time_offset / 5) + roll_noise
+        self.pitch = 10 * math.cos(self.time_offset / 7) + pitch_noise
+        self.yaw = (self.yaw + 1 + yaw_noise) % 360  # Slowly rotating with jitter
         
         # Altitude simulation (gentle oscillation)
-        self.altitude = 100 + 10 * math.sin(self.time_offset / 15) + random.uniform(-3, 3)
+        self.altitude = 100 + 10 * math.sin(self.time_offset / 15) + alt_noise
         
         # GPS simulation (drone moves in small circular pattern)
         circle_radius = 0.0001  # Small radius for GPS movement
@@ -62,30 +84,46 @@ class DroneDataGenerator:
         self.longitude += circle_radius * math.cos(self.time_offset / 20)
         
         # Connection health (occasional changes)
-        if random.random() < 0.01:  # 1% chance to change connection status each update
+        if connection_draw < 0.01:  # 1% chance to change connection status each update
             weights = [0.5, 0.3, 0.1, 0.07, 0.03]  # Weighted probabilities
             self.connection_health = random.choices(self.connection_states, weights=weights)[0]
             
+        # Round all values in one vectorized step
+        values = np.array([
+            self.battery_voltage,
+            (self.battery_voltage - 8.0) / 4.0 * 100,  # Calculate percentage (8V-12V range)
+            self.temperature,
+            self.altitude,
+            self.roll,
+            self.pitch,
+            self.yaw,
+            self.latitude,
+            self.longitude
+        ])
+        voltage, percentage, temperature, altitude, roll, pitch, yaw, latitude, longitude = (
+            np.round(values * ROUNDING_SCALE) / ROUNDING_SCALE
+        ).tolist()
+        
         # Format data as dictionary
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),  # Unix time in seconds
             "battery": {
-                "voltage": round(self.battery_voltage, 2),
-                "percentage": round((self.battery_voltage - 8.0) / 4.0 * 100, 1)  # Calculate percentage (8V-12V range)
+                "voltage": voltage,
+                "percentage": percentage
             },
             "sensors": {
-                "temperature": round(self.temperature, 1),
-                "altitude": round(self.altitude, 1)
+                "temperature": temperature,
+                "altitude": altitude
             },
             "imu": {
-                "roll": round(self.roll, 2),
-                "pitch": round(self.pitch, 2),
-                "yaw": round(self.yaw, 2)
+                "roll": roll,
+                "pitch": pitch,
+                "yaw": yaw
             },
             "gps": {
-                "latitude": round(self.latitude, 6),
-                "longitude": round(self.longitude, 6),
-                "altitude": round(self.altitude, 1)
+                "latitude": latitude,
+                "longitude": longitude,
+                "altitude": altitude
             },
             "connection": {
                 "status": self.connection_health,
@@ -93,6 +131,16 @@ class DroneDataGenerator:
             }
         }
     
+    def _next_noise(self):
+        """Return the random fluctuations for one update, drawing a new block when used up"""
+        if self.noise_index >= len(self.noise):
+            self.noise = self.rng.uniform(NOISE_LOW, NOISE_HIGH, size=(NOISE_BLOCK, len(NOISE_LOW))).tolist()
+            self.noise_index = 0
+        
+        noise = self.noise[self.noise_index]
+        self.noise_index += 1
+        return noise
+    
     def _get_signal_strength(self, status):
         """Convert text status to numeric signal strength"""
         mapping = {
@@ -109,10 +157,16 @@ async def transmit_data(websocket):
     drone = DroneDataGenerator()
     print(f"Client connected from {websocket.remote_address}")
     
+    batch = []
+    
     try:
         while True:
-            data = drone.generate_data()
-            await websocket.send(json.dumps(data))
+            batch.append(drone.generate_data())
+            
+            # Send accumulated data points as a single JSON array frame
+            if len(batch) >= BATCH_SIZE:
+                await websocket.send(orjson.dumps(batch))  # bytes, sent as a binary frame
+                batch.clear()
             await asyncio.sleep(UPDATE_INTERVAL)
     except websockets.exceptions.ConnectionClosed:
         print(f"Client disconnected from {websocket.remote_address}")
@@ -124,11 +178,15 @@ async def main():
     print(f"Starting drone telemetry transmitter server on ws://{server_host}:{server_port}")
     print("Press Ctrl+C to exit")
     
-    async with websockets.serve(transmit_data, server_host, server_port):
+    # Telemetry frames are small, compressing them costs more CPU than it saves bandwidth
+    async with websockets.serve(transmit_data, server_host, server_port, compression=None):
         await asyncio.Future()  # Run forever
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nServer stopped by user")
\ No newline at end of file